@@ -25,9 +25,9 @@ if os.name != "nt":
     except ImportError:
         logging.warning("Failed to import uvloop, running with default async event loop")
 
-bot = BattleFrontBot(Config())
-
 if __name__ == "__main__":
+    # Built here so banner worker processes, which import this module, don't create a bot of their own
+    bot = BattleFrontBot(Config())
     bot.run()
 
 
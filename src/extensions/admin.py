@@ -251,6 +251,9 @@ async def db_restore(ctx: BattlefrontBotPrefixContext) -> None:
         await con.execute("CREATE SCHEMA public;")
         await con.execute("GRANT ALL ON SCHEMA public TO postgres;")
 
+    # Every guild's rank roles are replaced, or lost if the restore fails
+    ctx.app.game_session_manager.clear_rank_roles()
+
     cmd = ["pg_restore", "-j", "4", "-d", ctx.app.db.dsn, dump_path]
 
     p = await asyncio.create_subprocess_exec(*cmd, stderr=asyncio.subprocess.PIPE)
@@ -265,7 +268,7 @@ async def db_restore(ctx: BattlefrontBotPrefixContext) -> None:
         )
         return
 
-    await ctx.app.db.migrate_schema()
+    await ctx.app.db.migrate_schema(refresh=True)
     await ctx.respond_with_success("**Database restore successful**", edit=True)
 
 
@@ -4,7 +4,6 @@ import datetime
 import os
 from collections import Counter
 from contextlib import suppress
-from io import BytesIO
 from random import randint
 
 import hikari
@@ -55,6 +54,7 @@ async def set_roles(
         white.id,
         ctx.guild_id,
     )
+    ctx.app.game_session_manager.clear_rank_roles(ctx.guild_id)
 
     await ctx.respond_with_success("**Successfully updated rank roles**")
 
@@ -76,8 +76,7 @@ async def start_caps(ctx: BattlefrontBotSlashContext, timeout: int) -> None:
         await ctx.respond_with_failure("**There is already a game session running in this channel**", ephemeral=True)
         return
 
-    record = await ctx.app.db.fetchrow("SELECT * FROM guilds WHERE guildId = $1", ctx.guild_id)
-    if not record or None in [record[f"rank{i}role"] for i in range(0, 4)]:
+    if not await ctx.app.game_session_manager.fetch_rank_roles(ctx.guild_id):
         await ctx.respond_with_failure(
             "Could not find rank roles for server, use `/roles` to configure rank roles", ephemeral=True
         )
@@ -329,11 +328,6 @@ def map_image_path_for(map: str) -> str:
     return os.path.join(battlefront.app.base_dir, "src", "static", "img", map.lower().replace(" ", "_") + ".jpg")
 
 
-def get_map_choices() -> list[str]:
-    """Get the list of maps excluding banned maps."""
-    return [map for map in MAPS if MAPS[map] != 0]
-
-
 def get_random_maps(index: int, amount: int, guild_id: hikari.Snowflake) -> list[str]:
     """Get a list of random maps.
 
@@ -352,7 +346,7 @@ def get_random_maps(index: int, amount: int, guild_id: hikari.Snowflake) -> list
         A list of map names.
 
     """
-    possible_maps = [map for map in MAPS if MAPS[map] >= index]
+    possible_maps = list(MAP_CHOICES_NONZERO) if index <= 1 else [map for map in MAPS if MAPS[map] >= index]
     maps = []
 
     for i in range(0, amount):
@@ -373,9 +367,9 @@ def get_random_maps(index: int, amount: int, guild_id: hikari.Snowflake) -> list
 @lightbulb.add_cooldown(60, 4, lightbulb.buckets.GuildBucket)
 @lightbulb.option("index", "Map index, default is 1", type=int, required=False, min_value=1, max_value=3)
 @lightbulb.option("amount", "Amount of random maps to generate", type=int, required=False, min_value=1, max_value=3)
-@lightbulb.option("map3", "Custom map slot 3", type=str, required=False, choices=get_map_choices())
-@lightbulb.option("map2", "Custom map slot 2", type=str, required=False, choices=get_map_choices())
-@lightbulb.option("map1", "Custom map slot 1", type=str, required=False, choices=get_map_choices())
+@lightbulb.option("map3", "Custom map slot 3", type=str, required=False, choices=list(MAP_CHOICES_NONZERO))
+@lightbulb.option("map2", "Custom map slot 2", type=str, required=False, choices=list(MAP_CHOICES_NONZERO))
+@lightbulb.option("map1", "Custom map slot 1", type=str, required=False, choices=list(MAP_CHOICES_NONZERO))
 @lightbulb.command(
     "mapvote", description="Picks random maps or uses provided for players to vote on", pass_options=True
 )
@@ -412,7 +406,8 @@ async def mapvote(
         return
 
     players = None
-    if session := ctx.app.game_session_manager.fetch_session(ctx.channel_id):
+    session = ctx.app.game_session_manager.fetch_session(ctx.channel_id)
+    if session:
         players = [p.member for p in session.players]
 
     options = [miru.SelectOption(map, value=map) for map in maps]
@@ -445,13 +440,13 @@ async def mapvote(
     except hikari.NotFoundError:
         return
 
-    if session := ctx.app.game_session_manager.fetch_session(ctx.channel_id):
+    if session is not None:
         session.set_map(winner_vote)
 
 
 @battlefront.command
 @lightbulb.add_cooldown(60, 4, lightbulb.buckets.GuildBucket)
-@lightbulb.option("name", "Name of the map", type=str, required=True, choices=[map for map in MAPS if MAPS[map] != 0])
+@lightbulb.option("name", "Name of the map", type=str, required=True, choices=list(MAP_CHOICES_NONZERO))
 @lightbulb.command("map", description="Get a map", pass_options=True)
 @lightbulb.implements(lightbulb.SlashCommand)
 async def get_map(ctx: BattlefrontBotSlashContext, name: str) -> None:
@@ -492,8 +487,8 @@ async def matchsummary(ctx: BattlefrontBotSlashContext, id: int) -> None:
         if member.id in match.loser_data["playerIds"]:
             loser_names.append(member.display_name)
 
-    b: BytesIO = await asyncio.get_running_loop().run_in_executor(
-        None,
+    banner = await asyncio.get_running_loop().run_in_executor(
+        ctx.app.banner_executor,
         generate_game_banner,
         [match.winner_data["name"], match.loser_data["name"]],
         (winner_score, loser_score),
@@ -511,7 +506,7 @@ async def matchsummary(ctx: BattlefrontBotSlashContext, id: int) -> None:
     embed.add_field(name=match.winner_data["name"], value=", ".join(winner_names))
     embed.add_field(name=match.loser_data["name"], value=", ".join(loser_names))
     embed.set_footer(str(match.id))
-    embed.set_image(hikari.Bytes(b.getvalue(), "banner.jpg"))
+    embed.set_image(hikari.Bytes(banner, "banner.jpg"))
 
     await ctx.respond(embed=embed)
 
@@ -548,8 +543,7 @@ async def forcestart(
         await ctx.respond_with_failure("**There is already a game session running in this channel**", ephemeral=True)
         return
 
-    record = await ctx.app.db.fetchrow("SELECT * FROM guilds WHERE guildId = $1", ctx.guild_id)
-    if not record or None in [record[f"rank{i}role"] for i in range(0, 4)]:
+    if not await ctx.app.game_session_manager.fetch_rank_roles(ctx.guild_id):
         await ctx.respond_with_failure(
             "Could not find rank roles for server, use `/roles` to configure rank roles", ephemeral=True
         )
@@ -585,7 +579,8 @@ async def flushcache(ctx: BattlefrontBotSlashContext) -> None:
 @lightbulb.command("end", description="Stops an ongoing session")
 @lightbulb.implements(lightbulb.SlashCommand)
 async def end_session(ctx: BattlefrontBotSlashContext) -> None:
-    session = ctx.app.game_session_manager.fetch_session(ctx.channel_id)
+    gsm = ctx.app.game_session_manager
+    session = gsm.fetch_session(ctx.channel_id)
     if not session:
         await ctx.respond_with_failure("**Could not find a game session for this channel**", ephemeral=True)
         return
@@ -595,12 +590,11 @@ async def end_session(ctx: BattlefrontBotSlashContext) -> None:
         return
 
     if not session.session_task:
-        ctx.app.game_session_manager.remove_session(ctx.channel_id)
+        gsm.remove_session(ctx.channel_id)
         await ctx.respond_with_failure("**Could not connect to session but ended it anyway**", ephemeral=True)
         return
 
-    ctx.app.game_session_manager.end_session(ctx.channel_id)
-    ctx.app.game_session_manager.remove_session(ctx.channel_id)  # Just in case
+    gsm.end_session(ctx.channel_id)
 
     await ctx.respond_with_success("**Ended session successfully**", ephemeral=True)
 
@@ -1,7 +1,9 @@
 import asyncio
 import datetime
 import logging
+import time
 import traceback
+import typing as t
 
 import hikari
 import lightbulb
@@ -13,9 +15,78 @@ logger = logging.getLogger(__name__)
 
 errorhandler = BattlefrontBotPlugin("errorhandler")
 
+# Responses for errors raised before or around command invocation, keyed by error type
+_COMMAND_ERROR_RESPONSES: dict[type[Exception], t.Callable[[t.Any], str]] = {
+    lightbulb.CommandIsOnCooldown: lambda e: f"**Command is on cooldown, try again in {round(e.retry_after)} seconds**",
+    lightbulb.MaxConcurrencyLimitReached: lambda _: "**Concurrency limit reached for this command, try again later**",
+    lightbulb.MissingRequiredPermission: lambda _: "**You lack the required permissions to execute this command**",
+    lightbulb.BotMissingRequiredPermission: lambda _: "**I am missing permissions required to execute this command**",
+    lightbulb.OnlyInGuild: lambda _: "**This command can only be used within a server**",
+    lightbulb.NotOwner: lambda _: "**You are not allowed to do this**",
+    lightbulb.CheckFailure: lambda _: "**Failed a pre-command check** *Is the bot in this channel?*",
+}
+
+# Responses for errors raised by the command itself, keyed by the type of the original error
+_INVOCATION_ERROR_RESPONSES: dict[type[Exception], t.Callable[[t.Any], str]] = {
+    hikari.InternalServerError: lambda _: "**An issue with Discord's servers prevented this, try again shortly**",
+    hikari.ForbiddenError: lambda e: f"**I do not have permission to perform this action:\n\n**```{e}```",
+    hikari.UnauthorizedError: lambda e: f"**I am unauthorised to access resources at this endpoint:\n\n**```{e}```",
+    asyncio.TimeoutError: lambda _: "**Command timed out**",
+}
+
+# Tracebacks with at least this many frames are formatted off the event loop
+_MAX_INLINE_TRACEBACK_DEPTH = 50
+
+# Repeats of the same error within this many seconds are counted instead of logged
+_ERROR_DEDUP_WINDOW = 60.0
+
+# Error key -> (time the error was last logged, repeats since then, the exception line)
+_error_dedup: dict[int, tuple[float, int, str]] = {}
+_error_log_lock = asyncio.Lock()
+# Strong references to pending log writes so they aren't garbage collected
+_log_tasks: set[asyncio.Task[None]] = set()
+
+
+def _find_error_response(
+    responses: dict[type[Exception], t.Callable[[t.Any], str]], error: BaseException
+) -> t.Callable[[t.Any], str] | None:
+    """Find the response for an error, checking the most specific error type first."""
+    for cls in type(error).__mro__:
+        if response := responses.get(cls):
+            return response
+
+    return None
+
+
+async def format_exception(error: BaseException) -> list[str]:
+    """Format an exception and its traceback, deep tracebacks are formatted on a separate thread.
+
+    Parameters
+    ----------
+    error : BaseException
+        The exception to format.
+
+    Returns
+    -------
+    list[str]
+        Formatted traceback chunks, as returned by traceback.format_exception.
+
+    """
+    depth = 0
+    tb = error.__traceback__
+
+    while tb is not None and depth < _MAX_INLINE_TRACEBACK_DEPTH:
+        tb = tb.tb_next
+        depth += 1
+
+    if depth < _MAX_INLINE_TRACEBACK_DEPTH:
+        return traceback.format_exception(type(error), error, error.__traceback__)
+
+    return await asyncio.to_thread(traceback.format_exception, type(error), error, error.__traceback__)
+
 
 async def log_error(
-    error: str,
+    error: list[str],
     ctx: BattlefrontBotContext | None = None,
     event: hikari.ExceptionEvent | None = None,
 ) -> None:
@@ -23,8 +94,8 @@ async def log_error(
 
     Parameters
     ----------
-    error : str
-        Error message for logging.
+    error : list[str]
+        Formatted traceback chunks for logging, as returned by traceback.format_exception.
     ctx : BBombsBotContext, optional
         Context for more information if provided, defaults to None.
     event : hikari.ExceptionEvent, optional
@@ -34,6 +105,31 @@ async def log_error(
     if not errorhandler.app.is_alive:
         return
 
+    # The last frame and the exception line identify repeats of the same error
+    key = hash(tuple(error[-2:]))
+    now = time.monotonic()
+    entry = _error_dedup.get(key)
+    repeats = 0
+
+    if entry is not None:
+        last_logged, repeats, summary = entry
+
+        if now - last_logged < _ERROR_DEDUP_WINDOW:
+            if repeats == 0:
+                # Reported when the window closes, unless the error is logged again first
+                asyncio.get_running_loop().call_later(
+                    last_logged + _ERROR_DEDUP_WINDOW - now, _schedule_repeat_report, key, last_logged
+                )
+
+            _error_dedup[key] = (last_logged, repeats + 1, summary)
+            return
+
+    # Errors with pending repeats are removed by their report instead
+    for stale_key in [k for k, v in _error_dedup.items() if now - v[0] >= _ERROR_DEDUP_WINDOW and not v[1]]:
+        _error_dedup.pop(stale_key)
+
+    _error_dedup[key] = (now, 0, error[-1].strip()[:1800])
+
     paginator = lightbulb.utils.StringPaginator(prefix="```py\n", suffix="```")
 
     if ctx:
@@ -49,8 +145,12 @@ async def log_error(
 
     paginator.add_line(msg)
 
-    for line in error.splitlines():
-        paginator.add_line(line)
+    for chunk in error:
+        for line in chunk.splitlines():
+            paginator.add_line(line)
+
+    if repeats:
+        paginator.add_line(f"# Repeated x{repeats} times since last logged")
 
     logs_channel = errorhandler.app.config.LOGGING_CHANNEL_ID
 
@@ -58,100 +158,117 @@ async def log_error(
         logger.warning("Logs channel id not found in config.")
         return
 
-    try:
-        for page in paginator.build_pages():
-            await errorhandler.app.rest.create_message(logs_channel, page)
-    except hikari.ForbiddenError:
-        logger.error("Missing access to logs channel.")
+    # Sent in the background so error handlers can respond to the user without waiting on the logs channel
+    _spawn_log_task(_send_log_pages(logs_channel, list(paginator.build_pages())))
 
 
-@errorhandler.listener(lightbulb.SlashCommandErrorEvent)
-@errorhandler.listener(lightbulb.MessageCommandErrorEvent)
-@errorhandler.listener(lightbulb.UserCommandErrorEvent)
-async def application_command_error_handler(event: lightbulb.CommandErrorEvent) -> None:
-    assert isinstance(event.context, BattlefrontBotContext)
-
-    ctx: BattlefrontBotContext = event.context
-    assert ctx.command is not None
-    error = event.exception.__cause__ or event.exception
+def _spawn_log_task(coro: t.Coroutine[t.Any, t.Any, None]) -> None:
+    """Run a log write in the background, keeping a reference to it until it is done."""
+    task = asyncio.create_task(coro)
+    _log_tasks.add(task)
+    task.add_done_callback(_log_tasks.discard)
 
-    if isinstance(error, lightbulb.CommandIsOnCooldown):
-        await ctx.respond_with_failure(
-            f"**Command is on cooldown, try again in {round(error.retry_after)} seconds**",
-            ephemeral=True,
-        )
-        return
 
-    if isinstance(error, lightbulb.MaxConcurrencyLimitReached):
-        await ctx.respond_with_failure(
-            "**Concurrency limit reached for this command, try again later**",
-            ephemeral=True,
-        )
+def _schedule_repeat_report(key: int, last_logged: float) -> None:
+    """Report the repeats of an error once its window closes, if it has not been logged again since."""
+    entry = _error_dedup.get(key)
+    if entry is None or entry[0] != last_logged:
         return
 
-    if isinstance(error, lightbulb.MissingRequiredPermission):
-        await ctx.respond_with_failure(
-            "**You lack the required permissions to execute this command**",
-            ephemeral=True,
-        )
-        return
+    _error_dedup.pop(key)
+    logs_channel = errorhandler.app.config.LOGGING_CHANNEL_ID
 
-    if isinstance(error, lightbulb.BotMissingRequiredPermission):
-        await ctx.respond_with_failure(
-            "**I am missing permissions required to execute this command**",
-            ephemeral=True,
-        )
+    if not errorhandler.app.is_alive or not logs_channel:
         return
 
-    if isinstance(error, lightbulb.OnlyInGuild):
-        await ctx.respond_with_failure("**This command can only be used within a server**", ephemeral=True)
-        return
+    page = f"```py\n# Repeated x{entry[1]} times since last logged\n{entry[2]}```"
+    _spawn_log_task(_send_log_pages(logs_channel, [page]))
 
-    if isinstance(error, lightbulb.NotOwner):
-        await ctx.respond_with_failure(
-            "**You are not allowed to do this**",
-            ephemeral=True,
-        )
-        return
 
-    if isinstance(error, lightbulb.CheckFailure):
-        await ctx.respond_with_failure(
-            "**Failed a pre-command check** *Is the bot in this channel?*",
-            ephemeral=True,
-        )
-        return
+async def _send_log_pages(logs_channel: int, pages: list[str]) -> None:
+    """Send the pages of an error log, retrying rate limited pages once after Discord's retry_after.
 
-    if isinstance(error, lightbulb.CommandInvocationError):
-        if isinstance(error.original, hikari.InternalServerError):
-            await ctx.respond_with_failure(
-                "**An issue with Discord's servers prevented this, try again shortly**",
-                edit=True,
-            )
+    Writes are serialised with a lock so error storms don't compete for the channel's rate limit,
+    the lock is released while waiting out a rate limit so other logs aren't held up behind it.
+    """
+    # Short tracebacks are sent concurrently, longer ones sequentially so the pages stay in order
+    concurrent = len(pages) <= 3
+    retried = False
+
+    while pages:
+        async with _error_log_lock:
+            if concurrent:
+                results = list(await asyncio.gather(*(_send_log_page(logs_channel, page) for page in pages)))
+            else:
+                results = []
+                for page in pages:
+                    results.append(result := await _send_log_page(logs_channel, page))
+                    if result is not None:
+                        break
+
+        if any(isinstance(result, hikari.ForbiddenError) for result in results):
+            logger.error("Missing access to logs channel.")
             return
 
-        if isinstance(error.original, hikari.ForbiddenError):
-            await ctx.respond_with_failure(
-                f"**I do not have permission to perform this action:\n\n**```{error.original}```",
-                edit=True,
-            )
-            return
+        for result in results:
+            if result is not None and not isinstance(result, hikari.RateLimitedError):
+                logger.error("Failed to send error log: %s: %s", result.__class__.__name__, result)
+                return
 
-        if isinstance(error.original, hikari.UnauthorizedError):
-            await ctx.respond_with_failure(
-                f"**I am unauthorised to access resources at this endpoint:\n\n**```{error.original}```",
-                edit=True,
-            )
+        limited = [e for e in results if isinstance(e, hikari.RateLimitedError)]
+        if not limited:
             return
 
-        if isinstance(error.original, asyncio.TimeoutError):
-            await ctx.respond_with_failure("**Command timed out**", edit=True)
+        # The rate limited pages, and when sending sequentially any pages left after them
+        unsent = [page for page, result in zip(pages, results) if result is not None]
+        unsent += pages[len(results) :]
+
+        if retried:
+            logger.warning("Dropped %s error log pages after being rate limited by the logs channel", len(unsent))
             return
 
-    logger.error(f"Ignoring exception in {ctx.guild_id} /{ctx.command.name} -> {error.__class__.__name__}: {error}")
-    error_str = "\n".join(traceback.format_exception(type(error), error, error.__traceback__))
-    await log_error(error_str, ctx=ctx)
+        await asyncio.sleep(max(e.retry_after for e in limited))
+        pages = unsent
+        retried = True
 
-    error = error.original if hasattr(error, "original") else error  # type: ignore
+
+async def _send_log_page(logs_channel: int, page: str) -> Exception | None:
+    """Send a page of an error log, returning the error instead of raising it if the page fails to send."""
+    try:
+        await errorhandler.app.rest.create_message(logs_channel, page)
+    except Exception as e:
+        return e
+
+    return None
+
+
+@errorhandler.listener(lightbulb.SlashCommandErrorEvent)
+@errorhandler.listener(lightbulb.MessageCommandErrorEvent)
+@errorhandler.listener(lightbulb.UserCommandErrorEvent)
+async def application_command_error_handler(event: lightbulb.CommandErrorEvent) -> None:
+    assert isinstance(event.context, BattlefrontBotContext)
+
+    ctx: BattlefrontBotContext = event.context
+    assert ctx.command is not None
+    error = event.exception.__cause__ or event.exception
+
+    if response := _find_error_response(_COMMAND_ERROR_RESPONSES, error):
+        await ctx.respond_with_failure(response(error), ephemeral=True)
+        return
+
+    original = getattr(error, "original", error)
+
+    if isinstance(error, lightbulb.CommandInvocationError) and (
+        response := _find_error_response(_INVOCATION_ERROR_RESPONSES, original)
+    ):
+        await ctx.respond_with_failure(response(original), edit=True)
+        return
+
+    logger.error(
+        "Ignoring exception in %s /%s -> %s: %s", ctx.guild_id, ctx.command.name, error.__class__.__name__, error
+    )
+    error_lines = await format_exception(error)
+    await log_error(error_lines, ctx=ctx)
 
     embed = hikari.Embed(
         title=f"{FAIL_EMOJI} Unknown Error",
@@ -163,7 +280,7 @@ async def application_command_error_handler(event: lightbulb.CommandErrorEvent)
     )
     embed.add_field(
         name="Error",
-        value=f"```{error.__class__.__name__}: {str(error).replace(errorhandler.app.config.TOKEN, 'TOKEN')}```",
+        value=f"```{original.__class__.__name__}: {str(original).replace(errorhandler.app.config.TOKEN, 'TOKEN')}```",
     )
     embed.set_footer(str(ctx.guild_id))
 
@@ -190,31 +307,29 @@ async def prefix_command_error_handler(event: lightbulb.PrefixCommandErrorEvent)
         return
     assert isinstance(event.context, BattlefrontBotContext)
 
-    error = (
-        event.exception.original  # type: ignore
-        if hasattr(event.exception, "original")
-        else event.exception
-    )
+    error = getattr(event.exception, "original", event.exception)
     ctx: BattlefrontBotContext = event.context
     assert ctx.command is not None
 
-    logger.error(f"Ignoring exception in prefix command {ctx.command.name} -> {error.__class__.__name__}: {error}")
+    logger.error(
+        "Ignoring exception in prefix command %s -> %s: %s", ctx.command.name, error.__class__.__name__, error
+    )
 
     await ctx.respond_with_failure(f"**Uncaught exception:**\n\n```{error.__class__.__name__}: {error}```", edit=True)
 
-    error_str = "\n".join(traceback.format_exception(type(error), error, error.__traceback__))
+    error_lines = await format_exception(error)
 
-    await log_error(error_str, ctx)
+    await log_error(error_lines, ctx)
 
 
 @errorhandler.listener(hikari.ExceptionEvent)
 async def event_error_handler(event: hikari.ExceptionEvent) -> None:
-    error_str = "\n".join(traceback.format_exception(*event.exc_info))
+    error_lines = await format_exception(event.exception)
 
-    logger.error(f"Ignoring exception in event listener {event.failed_event.__class__.__name__}:")
-    print(error_str)
+    logger.error("Ignoring exception in event listener %s:", event.failed_event.__class__.__name__)
+    print("".join(error_lines))
 
-    await log_error(error_str, event=event)
+    await log_error(error_lines, event=event)
 
 
 def load(bot: BattleFrontBot) -> None:
@@ -1,9 +1,7 @@
-import datetime
-from time import perf_counter_ns
+from time import monotonic, perf_counter
 
 import hikari
 import lightbulb
-import psutil
 
 from src.models import (
     BattleFrontBot,
@@ -15,7 +13,12 @@ from src.utils import bot_in_channel
 
 misc = BattlefrontBotPlugin("misc")
 
-psutil.cpu_percent(interval=1)
+INFO_DESCRIPTION_TEMPLATE = """Version: **{version}**
+Developer: **BBombs**
+Server Count: **{guild_count}**
+Uptime: **{hours} hours, {minutes} minutes**
+Invite: [Click here]({invite_url})
+Source: [Click here]({github_link})"""
 
 
 @misc.command
@@ -27,46 +30,57 @@ async def bot_info(ctx: BattlefrontBotSlashContext) -> None:
         await ctx.respond_with_failure("**The bot needs access to this channel for this command**", ephemeral=True)
         return
 
-    start = perf_counter_ns()
+    # Serve the cached embed straight away, skipping the loading response used to measure REST latency
+    if cached := ctx.app.info_embed_cache.get():
+        embed, rest_ms = cached
+        latency = f"Gateway: {ctx.app.gateway_latency_str}\nREST: {rest_ms:,.0f}ms"
+        await ctx.respond(embed=embed.edit_field(0, hikari.UNDEFINED, latency))
+        return
+
+    start = perf_counter()
     await ctx.loading()
-    end = perf_counter_ns()
+    rest_ms = (perf_counter() - start) * 1000
+    latency = f"Gateway: {ctx.app.gateway_latency_str}\nREST: {rest_ms:,.0f}ms"
 
-    tdelta = datetime.datetime.now() - ctx.app.start_time
-    tdelta_str = str(tdelta).split(".")[0].split(":")
+    uptime = int(monotonic() - ctx.app.start_monotonic)
+    hours, remainder = divmod(uptime, 3600)
 
     me = ctx.app.get_me()
     assert me is not None
 
-    process = psutil.Process()
-    gateway_latency = f"{ctx.app.heartbeat_latency * 1000:,.0f}ms"
+    cpu_percent, vms_mb = ctx.app.stats.snapshot()
 
-    await ctx.edit_last_response(
-        "",
-        embed=hikari.Embed(
+    embed = (
+        hikari.Embed(
             title=f"{me.username} Info",
-            description=f"""Version: **{ctx.app.version}**
-Developer: **BBombs**
-Server Count: **{len(ctx.app.cache.get_guilds_view())}**
-Uptime: **{tdelta_str[0]} hours, {tdelta_str[1]} minutes**
-Invite: [Click here]({INVITE_LINK_TEMPLATE.format(me.id)})
-Source: [Click here]({GITHUB_LINK})""",
+            description=INFO_DESCRIPTION_TEMPLATE.format(
+                version=ctx.app.version,
+                guild_count=ctx.app.guild_count,
+                hours=hours,
+                minutes=remainder // 60,
+                invite_url=ctx.app.invite_url,
+                github_link=GITHUB_LINK,
+            ),
             colour=DEFAULT_EMBED_COLOUR,
         )
         .add_field(
             name="Latency",
-            value=f"Gateway: {gateway_latency}\nREST: {(end - start) / 1000000:,.0f}ms",
+            value=latency,
         )
         .add_field(
             name="CPU Use",
-            value=f"{round(psutil.cpu_percent(interval=None))}%",
+            value=f"{round(cpu_percent)}%",
             inline=True,
         )
         .add_field(
             name="Memory Use",
-            value=f"{round(process.memory_info().vms / 1048576)}MB",
+            value=f"{vms_mb}MB",
             inline=True,
-        ),
+        )
     )
+    ctx.app.info_embed_cache.set(embed, rest_ms)
+
+    await ctx.edit_last_response("", embed=embed)
 
 
 def load(bot: BattleFrontBot) -> None:
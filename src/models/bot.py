@@ -1,22 +1,27 @@
 import datetime
 import logging
+import multiprocessing
 import os
+import time
 import tomllib
+import types
 import typing as t
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-import aiofiles
 import hikari
 import lightbulb
 import miru
+import psutil
 
 from src.config import Config
 from src.models.context import *
-from src.models.database import Database
+from src.models.database import ADD_GUILD_SQL, Database
 from src.models.database_member import DatabaseMember
 from src.models.errors import ApplicationStateError
 from src.models.game_session_manager import GameSessionManager
-from src.static import DEFAULT_EMBED_COLOUR
+from src.models.stats import InfoEmbedCache, StatsSampler
+from src.static import DEFAULT_EMBED_COLOUR, INVITE_LINK_TEMPLATE
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +36,16 @@ class BattleFrontBot(lightbulb.BotApp):
 
     """
 
+    # Shared by every guild join, a fresh embed is built from it each time
+    _WELCOME_EMBED_TEMPLATE: t.Final[t.Mapping[str, t.Any]] = types.MappingProxyType(
+        {
+            "title": "👋  Greetings",
+            "description": """I'm always listening for commands type / to see what I can do.
+Make sure to set the rank roles using `/roles`""",
+            "colour": DEFAULT_EMBED_COLOUR,
+        }
+    )
+
     def __init__(self, config: Config) -> None:
         self._bot_started = False
 
@@ -72,15 +87,41 @@ class BattleFrontBot(lightbulb.BotApp):
         self._config = config
         self._user_id: hikari.Snowflake
         self._start_time: datetime.datetime
-        self._base_dir = str(Path(os.path.abspath(__file__)).parents[2])
+        self._start_monotonic: float | None = None
+        self._base_dir: Path = Path(__file__).resolve().parents[2]
         self._debug_mode = config.DEBUG_MODE
         self._startup_guilds: list = []
-        self._version: str
+        # Guilds are tracked by id so repeated join or available events for a guild are only counted once
+        self._guild_ids: set[hikari.Snowflake] = set()
+        # Read once here rather than in the async startup listeners
+        toml = tomllib.loads((self._base_dir / "pyproject.toml").read_text())
+        self._version: str = toml.get("project", {}).get("version", "1.0.0")
+        self._invite_url: str
+        self._gateway_latency: tuple[float, str] = (float("nan"), "")
+        self._psutil_process = psutil.Process()
+        self._stats = StatsSampler(self._psutil_process)
+        self._info_embed_cache = InfoEmbedCache()
+        # Worker processes are only started once the first banner is rendered, they are started from a clean
+        # process rather than forked from this one, which has threads and open connections running
+        self._banner_executor = ProcessPoolExecutor(
+            max_workers=2, mp_context=multiprocessing.get_context("spawn" if os.name == "nt" else "forkserver")
+        )
 
         self._db = Database(self)
         self._miru_client = miru.Client(self, ignore_unknown_interactions=True)
         self._game_session_manager = GameSessionManager(self)
 
+        self._listeners: list[tuple[t.Type[hikari.Event], t.Callable[..., t.Awaitable[None]]]] = [
+            (hikari.StartingEvent, self.on_starting),
+            (hikari.StartedEvent, self.on_started),
+            (hikari.GuildAvailableEvent, self.on_guild_available),
+            (lightbulb.LightbulbStartedEvent, self.on_lightbulb_started),
+            (hikari.GuildJoinEvent, self.on_guild_join),
+            (hikari.GuildLeaveEvent, self.on_guild_leave),
+            (hikari.StoppedEvent, self.on_stop),
+            (hikari.MemberDeleteEvent, self.on_member_leave),
+        ]
+
     @property
     def is_started(self) -> bool:
         """A boolean based on whether the bot has started."""
@@ -95,7 +136,29 @@ class BattleFrontBot(lightbulb.BotApp):
         return self._version
 
     @property
-    def base_dir(self) -> str:
+    def invite_url(self) -> str:
+        """The url to invite the bot to a server."""
+        if self._invite_url is None:
+            raise ApplicationStateError("Bot invite_url is unavailable until bot has started")
+
+        return self._invite_url
+
+    @property
+    def gateway_latency_str(self) -> str:
+        """The gateway heartbeat latency formatted in milliseconds, only reformatted when the latency changes."""
+        latency = self.heartbeat_latency
+        if latency != self._gateway_latency[0]:
+            self._gateway_latency = (latency, f"{latency * 1000:,.0f}ms")
+
+        return self._gateway_latency[1]
+
+    @property
+    def guild_count(self) -> int:
+        """The number of guilds the bot is in."""
+        return len(self._guild_ids)
+
+    @property
+    def base_dir(self) -> Path:
         """The path to the root directory."""
         return self._base_dir
 
@@ -120,6 +183,34 @@ class BattleFrontBot(lightbulb.BotApp):
 
         return self._start_time
 
+    @property
+    def start_monotonic(self) -> float:
+        """The monotonic clock reading at which the bot started, for measuring uptime."""
+        if self._start_monotonic is None:
+            raise ApplicationStateError("Bot start_monotonic is unavailable until bot has started")
+
+        return self._start_monotonic
+
+    @property
+    def psutil_process(self) -> psutil.Process:
+        """The psutil process handle for the running bot."""
+        return self._psutil_process
+
+    @property
+    def stats(self) -> StatsSampler:
+        """The sampler for the bot's cpu and memory usage."""
+        return self._stats
+
+    @property
+    def info_embed_cache(self) -> InfoEmbedCache:
+        """The cache for the bot info embed."""
+        return self._info_embed_cache
+
+    @property
+    def banner_executor(self) -> ProcessPoolExecutor:
+        """The process pool used to render match banners off the event loop."""
+        return self._banner_executor
+
     @property
     def db(self) -> Database:
         """The database connection of the bot."""
@@ -137,14 +228,8 @@ class BattleFrontBot(lightbulb.BotApp):
 
     def run(self) -> None:
         """Start listeners and bot activity."""
-        self.subscribe(hikari.StartingEvent, self.on_starting)
-        self.subscribe(hikari.StartedEvent, self.on_started)
-        self.subscribe(hikari.GuildAvailableEvent, self.on_guild_available)
-        self.subscribe(lightbulb.LightbulbStartedEvent, self.on_lightbulb_started)
-        self.subscribe(hikari.GuildJoinEvent, self.on_guild_join)
-        self.subscribe(hikari.GuildLeaveEvent, self.on_guild_leave)
-        self.subscribe(hikari.StoppedEvent, self.on_stop)
-        self.subscribe(hikari.MemberDeleteEvent, self.on_member_leave)
+        for event_type, callback in self._listeners:
+            self.subscribe(event_type, callback)
 
         super().run(activity=hikari.Activity(name="Star Wars Battlefront II", type=hikari.ActivityType.PLAYING))
 
@@ -169,7 +254,7 @@ class BattleFrontBot(lightbulb.BotApp):
         await self.db.connect()
         await self.db.migrate_schema()
 
-        self.load_extensions_from(os.path.join(self.base_dir, "src", "extensions"), must_exist=True)
+        self.load_extensions_from(self.base_dir / "src" / "extensions", must_exist=True)
 
     async def on_started(self, event: hikari.StartedEvent) -> None:
         user = self.get_me()
@@ -178,18 +263,13 @@ class BattleFrontBot(lightbulb.BotApp):
 
         await self.game_session_manager.set_session_count()
 
-        toml_path = os.path.join(self.base_dir, "pyproject.toml")
-        version: str = "1.0.0"
-
-        async with aiofiles.open(toml_path, "rb") as file:
-            toml_data = await file.read()
-            toml = tomllib.loads(toml_data.decode("utf-8"))
-            self._version = toml.get("project", {}).get("version", version)
-
         if self._debug_mode:
             logger.warning("Debug mode is active")
 
     async def on_guild_available(self, event: hikari.GuildAvailableEvent) -> None:
+        # Still counted after startup, guilds that were unavailable at startup become available later
+        self._guild_ids.add(event.guild_id)
+
         if self.is_started:
             return
 
@@ -197,28 +277,27 @@ class BattleFrontBot(lightbulb.BotApp):
 
     async def on_lightbulb_started(self, event: lightbulb.LightbulbStartedEvent) -> None:
         async with self.db.pool.acquire() as con:
-            for guild in self._startup_guilds:
-                await con.execute(
-                    """INSERT INTO guilds (guildId) VALUES ($1)
-                    ON CONFLICT (guildId) DO NOTHING""",
-                    guild,
-                )
+            await con.executemany(ADD_GUILD_SQL, [(guild,) for guild in self._startup_guilds])
 
-        logger.info(f"Bot initialised as {self.get_me()} in {len(self._startup_guilds)} guilds")
+        logger.info("Bot initialised as %s in %d guilds", self.get_me(), len(self._startup_guilds))
 
         self._startup_guilds = []
 
+        if me := self.get_me():
+            self._invite_url = INVITE_LINK_TEMPLATE.format(me.id)
+
         self._bot_started = True
         self._start_time = datetime.datetime.now()
+        self._start_monotonic = time.monotonic()
+        self._stats.start()
 
         logger.info("BattleFrontBot initialised successfully")
 
-        self.unsubscribe(hikari.GuildAvailableEvent, self.on_guild_available)
-
     async def on_guild_join(self, event: hikari.GuildJoinEvent) -> None:
         await self.db.add_guild(event.guild_id)
+        self._guild_ids.add(event.guild_id)
 
-        logger.info(f"BattleFrontBot in new guild: {event.guild.name} ({event.guild_id})")
+        logger.info("BattleFrontBot in new guild: %s (%s)", event.guild.name, event.guild_id)
 
         me = event.guild.get_my_member()
 
@@ -228,12 +307,7 @@ class BattleFrontBot(lightbulb.BotApp):
         system_channel = event.guild.get_channel(event.guild.system_channel_id)
         assert isinstance(system_channel, hikari.TextableGuildChannel)
 
-        welcome_embed = hikari.Embed(
-            title="👋  Greetings",
-            description="""I'm always listening for commands type / to see what I can do.
-Make sure to set the rank roles using `/roles`""",
-            colour=DEFAULT_EMBED_COLOUR,
-        ).set_thumbnail(me.avatar_url)
+        welcome_embed = hikari.Embed(**self._WELCOME_EMBED_TEMPLATE).set_thumbnail(me.avatar_url)
 
         try:
             await system_channel.send(embed=welcome_embed)
@@ -242,15 +316,23 @@ Make sure to set the rank roles using `/roles`""",
 
     async def on_guild_leave(self, event: hikari.GuildLeaveEvent) -> None:
         await self.db.remove_guild(event.guild_id)
-        logger.info(f"BattleFrontBot removed from guild: {event.guild_id}")
+        self.game_session_manager.clear_rank_roles(event.guild_id)
+        self._guild_ids.discard(event.guild_id)
+        logger.info("BattleFrontBot removed from guild: %s", event.guild_id)
 
     async def on_member_leave(self, event: hikari.MemberDeleteEvent) -> None:
         user = await DatabaseMember.fetch(event.user, event.guild_id)
         await user.remove()
-        logger.info(f"User removed from guild: {event.user.display_name} - {event.guild_id}")
+        logger.info("User removed from guild: %s - %s", event.user.display_name, event.guild_id)
 
     async def on_stop(self, event: hikari.StoppedEvent) -> None:
         self._is_started = False
+        self._stats.stop()
+        self._banner_executor.shutdown(wait=False, cancel_futures=True)
+
+        for event_type, callback in self._listeners:
+            self.unsubscribe(event_type, callback)
+
         await self.db.close()
         logger.info("BattleFrontBot has been shut down")
 
@@ -19,6 +19,8 @@ __all__ = ["BattlefrontBotContext", "BattlefrontBotPrefixContext", "BattlefrontB
 class BattlefrontBotContext(lightbulb.Context, ABC):
     """BBombsBot base context object, abstract class."""
 
+    __slots__ = ()
+
     @property
     def app(self) -> BattleFrontBot:
         """Returns the current application."""
@@ -199,14 +201,20 @@ class BattlefrontBotContext(lightbulb.Context, ABC):
 class BattlefrontBotApplicationContext(BattlefrontBotContext, lightbulb.ApplicationContext, ABC):
     """BBombsBot ApplicationContext object."""
 
+    __slots__ = ()
+
 
 class BattlefrontBotSlashContext(BattlefrontBotApplicationContext, lightbulb.SlashContext):
     """BBombsBot SlashContext object."""
 
+    __slots__ = ()
+
 
 class BattlefrontBotPrefixContext(BattlefrontBotContext, lightbulb.PrefixContext):
     """BBombsBot SlashContext object."""
 
+    __slots__ = ()
+
 
 # Copyright (C) 2025 BBombs
 
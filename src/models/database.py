@@ -5,6 +5,7 @@ import importlib
 import logging
 import os
 import typing as t
+from pathlib import Path
 
 import aiofiles
 import asyncpg
@@ -15,9 +16,15 @@ if t.TYPE_CHECKING:
 
 from src.config import Config
 from src.models.errors import DatabaseStateError
+from src.utils import serialization
 
 logger = logging.getLogger(__name__)
 
+ADD_GUILD_SQL = """INSERT INTO guilds (guildId) VALUES ($1)
+ON CONFLICT (guildId) DO NOTHING"""
+
+REMOVE_GUILD_SQL = "DELETE FROM guilds WHERE guildId = $1"
+
 
 class Database:
     """Database class which implements asyncpg to access postgresql database."""
@@ -33,7 +40,10 @@ class Database:
         self._pool: asyncpg.Pool | None = None
         self._pool_closed: bool = False
         self._schema_version: int
-        self._migrations_dir: str = os.path.join(self._app.base_dir, "src", "sql", "migrations")
+        self._sql_dir: Path = self._app.base_dir / "src" / "sql"
+        self._migrations_dir: Path = self._sql_dir / "migrations"
+        self._schema_sql: str = (self._sql_dir / "schema.sql").read_text()
+        self._migration_sql: dict[str, str] = {}
 
         DatabaseModel._db = self
         DatabaseModel._app = self.app
@@ -87,13 +97,36 @@ class Database:
         return f"postgres://{self.user}:{self.password}@{self.host}:{self.port}/{self.db_name}"
 
     async def connect(self) -> None:
-        """Connect to the database and create a connection pool."""
+        """Connect to the database and create a connection pool.
+
+        Every pooled connection encodes and decodes json and jsonb values itself, so they are passed and returned as
+        Python objects.
+        """
         if self._pool_closed:
             raise DatabaseStateError("Database pool has been closed")
 
-        self._pool = await asyncpg.create_pool(dsn=self.dsn)
+        if self._pool is not None:
+            raise DatabaseStateError("Database is already connected")
+
+        # Statements are prepared once per connection and reused from this cache
+        self._pool = await asyncpg.create_pool(
+            dsn=self.dsn,
+            min_size=2,
+            max_size=10,
+            max_inactive_connection_lifetime=300,
+            command_timeout=10,
+            statement_cache_size=1024,
+            init=self._init_connection,
+        )
         await self.compile_schema()
-        self._schema_version = await self.pool.fetchval("SELECT schemaVersion FROM databaseSchema", column=0)
+        await self._fetch_schema_version()
+
+    async def _init_connection(self, con: asyncpg.Connection) -> None:
+        # Registered once per pooled connection, so queries never need to serialize json themselves
+        for json_type in ("json", "jsonb"):
+            await con.set_type_codec(
+                json_type, encoder=serialization.dumps, decoder=serialization.loads, schema="pg_catalog"
+            )
 
     async def execute(self, query: str, *args) -> str:
         """Execute a command on the database server.
@@ -171,11 +204,8 @@ class Database:
 
     async def compile_schema(self) -> None:
         """Create necessary database tables if not already present."""
-        async with (
-            self.pool.acquire() as con,
-            aiofiles.open(os.path.join(self._app.base_dir, "src", "sql", "schema.sql")) as f,
-        ):
-            await con.execute(await f.read())
+        async with self.pool.acquire() as con:
+            await con.execute(self._schema_sql)
 
     async def increment_schema_version(self) -> None:
         """Increment the current schema version."""
@@ -185,14 +215,17 @@ class Database:
         )
 
         self._schema_version = version["schemaversion"]
-        logger.info(f"Schema updated to version {self._schema_version}")
+        logger.info("Schema updated to version %d", self._schema_version)
 
     async def do_sql_migration(self, file: str) -> None:
         """Execute an SQL file as apart of a database migration."""
-        async with aiofiles.open(os.path.join(self._migrations_dir, file)) as f:
-            await self.execute(await f.read())
+        if file not in self._migration_sql:
+            async with aiofiles.open(self._migrations_dir / file) as f:
+                self._migration_sql[file] = await f.read()
+
+        await self.execute(self._migration_sql[file])
 
-        logger.info(f"Updated database schema with migration {file}")
+        logger.info("Updated database schema with migration %s", file)
         await self.increment_schema_version()
 
     async def do_python_migration(self, file: str) -> None:
@@ -203,30 +236,52 @@ class Database:
         module = importlib.import_module(f"sql.migrations.{file[:-3]}")
         await module.run(self)
 
-        logger.info(f"Updated database schema with migration {file}")
+        logger.info("Updated database schema with migration %s", file)
         await self.increment_schema_version()
 
-    async def migrate_schema(self) -> None:
-        """Update the database schema with pending migrations."""
-        await self.compile_schema()
+    async def _fetch_schema_version(self) -> None:
+        version = await self.fetchval("SELECT schemaVersion FROM databaseSchema", column=0)
+        if not isinstance(version, int):
+            raise ValueError(f"Expected int for schema version, not {version}")
 
-        async with self.pool.acquire() as con:
-            version = await con.fetchval("SELECT schemaVersion FROM databaseSchema", column=0)
-            if not isinstance(version, int):
-                raise ValueError(f"Expected int for schema version, not {version}")
+        self._schema_version = version
 
-            self._schema_version = version
+    async def migrate_schema(self, refresh: bool = False) -> None:
+        """Update the database schema with pending migrations.
 
-        for file in os.listdir(self._migrations_dir):
-            try:
-                if file.startswith("migration_") and int(file[10]) > self._schema_version:
-                    if file.endswith(".sql"):
-                        await self.do_sql_migration(file)
-                    elif file.endswith(".py"):
-                        await self.do_python_migration(file)
+        The schema is compiled and its version fetched on connect, so this is only repeated when refreshing.
 
-            except ValueError:
-                logger.warning("Migration filenames must include a version e.g. 'migration_1.sql'")
+        Parameters
+        ----------
+        refresh : bool
+            Whether to compile the schema and fetch its version again first, e.g. after a restore, defaults to False.
+
+        """
+        if refresh:
+            await self.compile_schema()
+            await self._fetch_schema_version()
+
+        migrations: list[tuple[int, str]] = []
+
+        with os.scandir(self._migrations_dir) as entries:
+            for entry in entries:
+                if not entry.name.startswith("migration_") or not entry.is_file():
+                    continue
+
+                try:
+                    migrations.append((int(entry.name.split("_", 1)[1].split(".", 1)[0]), entry.name))
+                except ValueError:
+                    logger.warning("Migration filenames must include a version e.g. 'migration_1.sql'")
+
+        # Apply migrations in version order
+        for version, file in sorted(migrations):
+            if version <= self._schema_version:
+                continue
+
+            if file.endswith(".sql"):
+                await self.do_sql_migration(file)
+            elif file.endswith(".py"):
+                await self.do_python_migration(file)
 
     async def add_guild(self, guild: hikari.Snowflake) -> None:
         """Add a new guild to the database (does nothing on conflict).
@@ -237,11 +292,7 @@ class Database:
             Guild to add.
 
         """
-        await self.execute(
-            """INSERT INTO guilds (guildId) VALUES ($1)
-            ON CONFLICT (guildId) DO NOTHING""",
-            guild,
-        )
+        await self.execute(ADD_GUILD_SQL, guild)
 
     async def remove_guild(self, guild: hikari.Snowflake) -> None:
         """Remove a guild and all associated data from the database.
@@ -252,7 +303,7 @@ class Database:
             Guild to remove.
 
         """
-        await self.execute("DELETE FROM guilds WHERE guildId = $1", guild)
+        await self.execute(REMOVE_GUILD_SQL, guild)
 
     async def close(self) -> None:
         """Close current connection pool."""
@@ -272,6 +323,9 @@ class Database:
 
 
 class DatabaseModel(abc.ABC):
+    # Empty so slotted attrs subclasses don't get a per-instance __dict__
+    __slots__ = ()
+
     _db: Database
     _app: BattleFrontBot
 
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import datetime
-import json
 import typing as t
 
 import attr
@@ -10,8 +9,43 @@ import hikari
 from src.models.database import DatabaseModel
 from src.models.errors import GameSessionError
 
-
-@attr.define
+UPDATE_MATCH_SQL = """
+INSERT INTO matches (matchId, guildId, winnerData, loserData, matchTied, matchDate, mapName)
+VALUES ($1, $2, $3, $4, $5, $6, $7)
+ON CONFLICT (matchId) DO
+UPDATE SET winnerData = $3, loserData = $4, matchTied = $5, matchDate = $6, mapName = $7;
+"""
+
+FETCH_MATCH_SQL = "SELECT * FROM matches WHERE matchId = $1"
+
+# Winners and losers are upserted in a single statement, with per-row win, loss and tie increments
+UPDATE_MATCH_MEMBERS_SQL = """
+WITH new_members AS (
+SELECT unnest($1::bigint[]) AS user_id,
+       unnest($2::smallint[]) AS w,
+       unnest($3::smallint[]) AS l,
+       unnest($4::smallint[]) AS t
+)
+INSERT INTO members (userId, guildId, rank, wins, loses, ties)
+SELECT user_id, $5::bigint, 0, w, l, t
+FROM new_members
+ON CONFLICT (userId, guildId)
+DO UPDATE SET wins = members.wins + EXCLUDED.wins,
+              loses = members.loses + EXCLUDED.loses,
+              ties = members.ties + EXCLUDED.ties;
+"""
+
+_AMEND_MEMBERS_SQL = """
+UPDATE members SET {0} = members.{0} + 1, {1} = members.{1} - 1
+WHERE members.userId = ANY($1::bigint[]) AND members.guildId = $2;
+"""
+
+AMEND_WINNERS_SQL = _AMEND_MEMBERS_SQL.format("wins", "loses")
+
+AMEND_LOSERS_SQL = _AMEND_MEMBERS_SQL.format("loses", "wins")
+
+
+@attr.define(eq=False, weakref_slot=False)
 class DatabaseMatch(DatabaseModel):
     """Dataclass for stored matches in the database."""
 
@@ -39,16 +73,11 @@ class DatabaseMatch(DatabaseModel):
     async def update(self) -> None:
         """Update this match or add it if not already stored."""
         await self._db.execute(
-            """
-            INSERT INTO matches (matchId, guildId, winnerData, loserData, matchTied, matchDate, mapName)
-            VALUES ($1, $2, $3, $4, $5, $6, $7)
-            ON CONFLICT (matchId) DO
-            UPDATE SET winnerData = $3, loserData = $4, matchTied = $5, matchDate = $6, mapName = $7;
-            """,
+            UPDATE_MATCH_SQL,
             self.id,
             self.guild_id,
-            json.dumps(self.winner_data),
-            json.dumps(self.loser_data),
+            self.winner_data,
+            self.loser_data,
             self.tied,
             self.date,
             self.map,
@@ -69,7 +98,7 @@ class DatabaseMatch(DatabaseModel):
             Dataclass for stored match in the database or a default match if no such match exists.
 
         """
-        record = await cls._db.fetchrow("SELECT * FROM matches WHERE matchId = $1", match_id)
+        record = await cls._db.fetchrow(FETCH_MATCH_SQL, match_id)
 
         if not record:
             return cls(match_id, None)
@@ -79,8 +108,8 @@ class DatabaseMatch(DatabaseModel):
             hikari.Snowflake(record["guildid"]),
             date=record["matchdate"],
             map=record["mapname"],
-            winner_data=json.loads(record["winnerdata"]),
-            loser_data=json.loads(record["loserdata"]),
+            winner_data=record["winnerdata"],
+            loser_data=record["loserdata"],
             tied=record["matchtied"],
         )
 
@@ -89,46 +118,24 @@ class DatabaseMatch(DatabaseModel):
         if not self.winner_data or not self.loser_data:
             raise GameSessionError("Cannot update members without match results")
 
-        query = """
-        WITH new_members AS (
-        SELECT unnest($1::bigint[]) AS user_id,
-               unnest($2::bigint[]) AS guild_id
-        )
-        INSERT INTO members (userId, guildId, rank, wins, loses, ties)
-        SELECT user_id, guild_id, 0, {0}, {1}, {2}
-        FROM new_members
-        ON CONFLICT (userId, guildId)
-        DO UPDATE SET {3} = members.{3} + 1;
-        """
+        winner_ids, loser_ids = self.winner_data["playerIds"], self.loser_data["playerIds"]
+        player_ids = [*winner_ids, *loser_ids]
+        winners, losers = len(winner_ids), len(loser_ids)
 
         if self.tied:
-            all_player_ids = [*self.winner_data["playerIds"], *self.loser_data["playerIds"]]
-            await self._db.execute(query.format(*["0", "0", "1", "ties"]), all_player_ids, [self.guild_id] * 8)
-            return
+            wins, loses, ties = [0] * (winners + losers), [0] * (winners + losers), [1] * (winners + losers)
+        else:
+            wins, loses, ties = [1] * winners + [0] * losers, [0] * winners + [1] * losers, [0] * (winners + losers)
 
-        await self._db.execute(
-            query.format(*["1", "0", "0", "wins"]), self.winner_data["playerIds"], [self.guild_id] * 4
-        )
-        await self._db.execute(
-            query.format(*["0", "1", "0", "loses"]), self.loser_data["playerIds"], [self.guild_id] * 4
-        )
+        await self._db.execute(UPDATE_MATCH_MEMBERS_SQL, player_ids, wins, loses, ties, self.guild_id)
 
     async def amend_members(self) -> None:
         """Amend the individual players of this match by reversing the results."""
         if not self.winner_data or not self.loser_data:
             raise GameSessionError("Cannot update members without match results")
 
-        query = """
-       WITH new_members AS (
-       SELECT unnest($1::bigint[]) AS user_id,
-              unnest($2::bigint[]) AS guild_id
-       )
-       UPDATE members SET {0} = members.{0} + 1, {1} = members.{1} - 1
-       FROM new_members nm 
-       WHERE members.userId = nm.user_id AND members.guildId = nm.guild_id;
-       """
-        await self._db.execute(query.format(*["wins", "loses"]), self.winner_data["playerIds"], [self.guild_id] * 4)
-        await self._db.execute(query.format(*["loses", "wins"]), self.loser_data["playerIds"], [self.guild_id] * 4)
+        await self._db.execute(AMEND_WINNERS_SQL, self.winner_data["playerIds"], self.guild_id)
+        await self._db.execute(AMEND_LOSERS_SQL, self.loser_data["playerIds"], self.guild_id)
 
 
 # Copyright (C) 2025 BBombs
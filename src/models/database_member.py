@@ -2,13 +2,27 @@ from __future__ import annotations
 
 import typing as t
 
+import asyncpg
 import attr
 import hikari
 
 from src.models.database import DatabaseModel
 
+UPDATE_MEMBER_SQL = """
+INSERT INTO members (userId, guildId, rank, wins, loses, ties, mu, sigma)
+VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
+ON CONFLICT (userId, guildId) DO
+UPDATE SET rank = $3, wins = $4, loses = $5, ties = $6, mu = $7, sigma = $8;
+"""
 
-@attr.define
+FETCH_MEMBER_SQL = "SELECT * FROM members WHERE userId = $1 and guildId = $2"
+
+FETCH_MEMBERS_SQL = "SELECT * FROM members WHERE guildId = $2 AND userId = ANY($1::bigint[])"
+
+REMOVE_MEMBER_SQL = "DELETE FROM members WHERE userId = $1 AND guildId = $2"
+
+
+@attr.define(eq=False, weakref_slot=False)
 class DatabaseMember(DatabaseModel):
     """Dataclass for stored members in the database."""
 
@@ -39,12 +53,7 @@ class DatabaseMember(DatabaseModel):
     async def update(self) -> None:
         """Update this member or add them if not already stored."""
         await self._db.execute(
-            """
-            INSERT INTO members (userId, guildId, rank, wins, loses, ties, mu, sigma)
-            VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
-            ON CONFLICT (userId, guildId) DO
-            UPDATE SET rank = $3, wins = $4, loses = $5, ties = $6, mu = $7, sigma = $8;
-            """,
+            UPDATE_MEMBER_SQL,
             int(self.id),
             int(self.guild_id),
             self.rank,
@@ -74,17 +83,56 @@ class DatabaseMember(DatabaseModel):
             Dataclass for stored member in the database or a default member if no such member exists.
 
         """
-        record = await cls._db.fetchrow(
-            "SELECT * FROM members WHERE userId = $1 and guildId = $2", hikari.Snowflake(user), hikari.Snowflake(guild)
-        )
+        user_id = hikari.Snowflake(user)
+        guild_id = hikari.Snowflake(guild)
+
+        record = await cls._db.fetchrow(FETCH_MEMBER_SQL, user_id, guild_id)
 
         if not record:
-            member = cls(hikari.Snowflake(user), hikari.Snowflake(guild))
-            return member
+            return cls(user_id, guild_id)
+
+        return cls._from_record(record, user_id, guild_id)
+
+    @classmethod
+    async def fetch_many(
+        cls,
+        users: t.Sequence[hikari.SnowflakeishOr[hikari.PartialUser]],
+        guild: hikari.SnowflakeishOr[hikari.PartialGuild],
+    ) -> dict[hikari.Snowflake, t.Self]:
+        """Fetch many users from the same guild from the database in a single query.
+
+        Parameters
+        ----------
+        users : Sequence[hikari.Snowflake]
+            User IDs for the members to be fetched.
+        guild : hikari.Snowflake
+            Guild of the members to be fetched.
+
+        Returns
+        -------
+        dict[hikari.Snowflake, DatabaseMember]
+            Stored members keyed by user ID, with a default member for each user that is not stored.
+
+        """
+        user_ids = [hikari.Snowflake(user) for user in users]
+        guild_id = hikari.Snowflake(guild)
 
+        records = await cls._db.fetch(FETCH_MEMBERS_SQL, user_ids, guild_id)
+        stored = {record["userid"]: record for record in records}
+        members: dict[hikari.Snowflake, t.Self] = {}
+
+        for user_id in user_ids:
+            record = stored.get(user_id)
+            members[user_id] = cls._from_record(record, user_id, guild_id) if record else cls(user_id, guild_id)
+
+        return members
+
+    @classmethod
+    def _from_record(cls, record: asyncpg.Record, user_id: hikari.Snowflake, guild_id: hikari.Snowflake) -> t.Self:
+        # The IDs are the ones the record was queried with, so they are reused rather than rebuilt from the record
         return cls(
-            hikari.Snowflake(record["userid"]),
-            hikari.Snowflake(record["guildid"]),
+            user_id,
+            guild_id,
             rank=record["rank"],
             wins=record["wins"],
             loses=record["loses"],
@@ -94,13 +142,7 @@ class DatabaseMember(DatabaseModel):
         )
 
     async def remove(self) -> None:
-        await self._db.execute(
-            """
-            DELETE FROM members WHERE userId = $1 AND guildId = $2
-            """,
-            self.id,
-            self.guild_id,
-        )
+        await self._db.execute(REMOVE_MEMBER_SQL, self.id, self.guild_id)
 
 
 # Copyright (C) 2025 BBombs
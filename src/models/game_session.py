@@ -4,14 +4,15 @@ __all__ = ["GameSession", "SessionContext"]
 
 import asyncio
 import datetime
+import heapq
 import itertools
 import math
 import os
+import time
 import typing as t
 from collections import Counter
 from contextlib import suppress
-from io import BytesIO
-from random import randint
+from random import choices
 
 import hikari
 
@@ -26,15 +27,22 @@ from src.models.views import CapsVotingView, RetryView
 from src.static import *
 from src.utils import generate_game_banner
 
+# Every 4v4 split of 8 players once, each as the team with the first player and its complement
+_TEAM_SPLITS: tuple[tuple[tuple[int, ...], tuple[int, ...]], ...] = tuple(
+    ((0, *others), tuple(i for i in range(1, 8) if i not in others))
+    for others in itertools.combinations(range(1, 8), 3)
+)
+
+# Matches offered to players in matchmaking voting, four per round of voting, every full group of splits
+MAX_PROPOSED_MATCHES = len(_TEAM_SPLITS) // 4 * 4
+
+# Minimum seconds between edits of the round embed, keeps rapid score submissions under the channel rate limit
+ROUND_EDIT_INTERVAL = 1.0
 
-def create_team_name() -> str:
-    """Create a team name from the 2 team seed wordlists."""
-    name = (
-        TEAM_NAME_KEY_1[randint(0, len(TEAM_NAME_KEY_1) - 1)]
-        + " "
-        + TEAM_NAME_KEY_2[randint(0, len(TEAM_NAME_KEY_2) - 1)]
-    )
-    return name
+
+def create_team_names(k: int) -> list[str]:
+    """Create k team names from the 2 team seed wordlists, drawing each wordlist in a single call."""
+    return [f"{first} {second}" for first, second in zip(choices(TEAM_NAME_KEY_1, k=k), choices(TEAM_NAME_KEY_2, k=k))]
 
 
 def ellipsize(s: str, width: int) -> str:
@@ -47,6 +55,8 @@ def ellipsize(s: str, width: int) -> str:
 class GamePlayer:
     """Player object for GameSessions."""
 
+    __slots__ = ("member", "name", "role", "rank", "mu", "sigma")
+
     def __init__(self, member: hikari.Member, name: str, role: int, rank: int, mu: float, sigma: float) -> None:
         """Player object for GameSessions.
 
@@ -77,6 +87,8 @@ class GamePlayer:
 class GameTeam:
     """Team object for GameSessions."""
 
+    __slots__ = ("players", "name", "skill")
+
     def __init__(self, players: list[GamePlayer], name: str, skill: int) -> None:
         """Team object for GameSessions.
 
@@ -98,6 +110,18 @@ class GameTeam:
 class GameMatch:
     """Game Match object for GameSessions."""
 
+    __slots__ = (
+        "team1",
+        "team2",
+        "round1_winner",
+        "round2_winner",
+        "round1_scores",
+        "round2_scores",
+        "winner",
+        "loser",
+        "final_scores",
+    )
+
     def __init__(self, team1: GameTeam, team2: GameTeam) -> None:
         """Game Match object for GameSessions.
 
@@ -142,24 +166,17 @@ def format_team_voting_embed(matches_group: list[GameMatch]) -> tuple[hikari.Emb
         colour=DEFAULT_EMBED_COLOUR,
     )
 
-    all_lefts = []
-    for match in matches_group:
-        for p in match.team1.players:
-            all_lefts.append(f"0| {p.name}")
-
-    max_left_width = max(len(s) for s in all_lefts)
-    cutoff = min(max_left_width, 24)
+    # Left column strings are built once and reused for both the column width and the lines
+    all_lefts = [[f"{p.role}| {p.name}" for p in match.team1.players] for match in matches_group]
+    cutoff = min(max(len(s) for s in itertools.chain.from_iterable(all_lefts)), 24)
     fields = []
 
-    for i, match in enumerate(matches_group, 1):
+    for i, (match, lefts) in enumerate(zip(matches_group, all_lefts), 1):
         lines = []
 
-        for left, right in zip(match.team1.players, match.team2.players):
-            left_str = f"{left.role}| {left.name}"
-            right_str = f"{right.role}| {right.name}"
-
+        for left_str, right in zip(lefts, match.team2.players):
             left_trunc = ellipsize(left_str, cutoff).ljust(cutoff)
-            right_trunc = ellipsize(right_str, cutoff)
+            right_trunc = ellipsize(f"{right.role}| {right.name}", cutoff)
             lines.append(f"{left_trunc} {right_trunc}")
 
         teams = f"**{match.team1.name}** - vs - **{match.team2.name}**```{'\n'.join(lines)}```"
@@ -193,6 +210,8 @@ class SessionContext:
         self._channel = channel
         self._author = author
         self._last_response: hikari.Message
+        self._round_embed: hikari.Embed | None = None
+        self._last_round_edit: float = 0.0
 
     @property
     def app(self) -> BattleFrontBot:
@@ -389,63 +408,65 @@ class SessionContext:
 
         """
         sides = ["Light", "Dark"] if round_no == 1 else ["Dark", "Light"]
+        embed = self._round_embed
+
+        # The rosters never change, so the embed is built once and only the changed parts are updated
+        if embed is None:
+            embed = self._round_embed = hikari.Embed(
+                description=f"**{match.team1.name}** (Rank {match.team1.skill}) vs "
+                f"**{match.team2.name}** (Rank {match.team2.skill})",
+                colour=DEFAULT_EMBED_COLOUR,
+            )
+            embed.add_field(
+                name=match.team1.name, value="\n".join([player.name for player in match.team1.players]), inline=True
+            )
+            embed.add_field(
+                name=match.team2.name, value="\n".join([player.name for player in match.team2.players]), inline=True
+            )
 
         if match.winner:
-            win_title = (
+            embed.title = (
                 f"{match.winner.name} Wins: {match.final_scores[0]} - {match.final_scores[1]}"
                 if match.final_scores[0] != match.final_scores[1]
                 else "Teams Tied"
             )
-            win_desc = f"{match.team1.name} ({match.final_scores[0]}) vs {match.team2.name} ({match.final_scores[1]})"
-
-        embed = hikari.Embed(
-            title=f"Round {round_no}" if not match.winner else win_title,
-            description=f"**{match.team1.name}** (Rank {match.team1.skill}) vs "
-            f"**{match.team2.name}** (Rank {match.team2.skill})"
-            if not match.winner
-            else win_desc,
-            colour=DEFAULT_EMBED_COLOUR,
-        )
-        embed.add_field(
-            name=f"{match.team1.name}{f' ({sides[0]} Side)' if not match.winner else ''}",
-            value="\n".join(player.name for player in match.team1.players),
-            inline=True,
-        )
-        embed.add_field(
-            name=f"{match.team2.name}{f' ({sides[1]} Side)' if not match.winner else ''}",
-            value="\n".join(player.name for player in match.team2.players),
-            inline=True,
-        )
-        embed.set_footer("Waiting for scores..." if not match.winner else "Session finished")
+            embed.description = (
+                f"{match.team1.name} ({match.final_scores[0]}) vs {match.team2.name} ({match.final_scores[1]})"
+            )
+            embed.edit_field(0, match.team1.name)
+            embed.edit_field(1, match.team2.name)
+            embed.set_footer("Session finished")
+        else:
+            embed.title = f"Round {round_no}"
+            embed.edit_field(0, f"{match.team1.name} ({sides[0]} Side)")
+            embed.edit_field(1, f"{match.team2.name} ({sides[1]} Side)")
+            embed.set_footer("Waiting for scores...")
+
         if map is not None:
             embed.set_image(
                 os.path.join(self.app.base_dir, "src", "static", "img", map.lower().replace(" ", "_") + ".jpg")
             )
 
-        if match.round1_winner:
-            if match.round1_scores[0] == match.round1_scores[1]:
-                winning_msg = "Teams Tied"
-            else:
-                winning_msg = f"{match.round1_winner.name} Wins"
+        round_results = [(match.round1_winner, match.round1_scores), (match.round2_winner, match.round2_scores)]
 
-            embed.add_field(
-                name="Round 1",
-                value=f"**{winning_msg}**\n{match.round1_scores[0]} - {match.round1_scores[1]}",
-                inline=False,
-            )
-
-        if match.round2_winner:
-            if match.round2_scores[0] == match.round2_scores[1]:
-                winning_msg = "Teams Tied"
-            else:
-                winning_msg = f"{match.round2_winner.name} Wins"
+        # Only rounds completed since the last update are added, after the two team fields
+        for round_index in range(len(embed.fields) - 2, len(round_results)):
+            round_winner, round_scores = round_results[round_index]
+            if not round_winner:
+                break
 
+            winning_msg = "Teams Tied" if round_scores[0] == round_scores[1] else f"{round_winner.name} Wins"
             embed.add_field(
-                name="Round 2",
-                value=f"**{winning_msg}**\n{match.round2_scores[0]} - {match.round2_scores[1]}",
+                name=f"Round {round_index + 1}",
+                value=f"**{winning_msg}**\n{round_scores[0]} - {round_scores[1]}",
                 inline=False,
             )
 
+        # Every round is still shown, back-to-back edits are only spaced out rather than dropped
+        if (wait := self._last_round_edit + ROUND_EDIT_INTERVAL - time.monotonic()) > 0:
+            await asyncio.sleep(wait)
+
+        self._last_round_edit = time.monotonic()
         return await self.edit_last_response("", embed=embed, components=[])
 
     async def send_match_summary(self, match: GameMatch, session_id: int) -> None:
@@ -462,9 +483,9 @@ class SessionContext:
         if not match.winner:
             raise GameSessionError("Cannot create a match summary for an incomplete match")
 
-        # Call generate_game_banner on a thread from the existing asyncio pool
-        b: BytesIO = await asyncio.get_running_loop().run_in_executor(
-            None,
+        # Rendering is CPU bound, so it runs in the bot's banner process pool
+        banner = await asyncio.get_running_loop().run_in_executor(
+            self.app.banner_executor,
             generate_game_banner,
             [match.team1.name, match.team2.name],
             match.final_scores,
@@ -476,7 +497,7 @@ class SessionContext:
             f"Congrats {', '.join([player.member.mention for player in match.winner.players])} for winning "
             f"{match.final_scores[0]} - {match.final_scores[1]} against their opponents (*match: {session_id}*)",
             user_mentions=True,
-            attachment=hikari.Bytes(b.getvalue(), "banner.jpg"),
+            attachment=hikari.Bytes(banner, "banner.jpg"),
         )
 
 
@@ -495,12 +516,13 @@ class GameSession:
         self._ctx = ctx
         self._players: list[GamePlayer]
         self._rank_roles: dict[int, hikari.Snowflake]
+        self._role_ranks: dict[hikari.Snowflake, int] = {}
         self._id: int
         self._session_task: asyncio.Task[t.Any] | None = None
         self._session_manager = ctx.app.game_session_manager
-        self._latest_score: tuple[int, int] = (0, 0)
         self._match: GameMatch
-        self._event = asyncio.Event()
+        # Scores for each round in submission order, None is queued to end the game loop
+        self._scores: asyncio.Queue[tuple[int, int] | None] = asyncio.Queue()
         self._map: str | None = None
 
     @property
@@ -529,11 +551,6 @@ class GameSession:
             raise GameSessionError("Session must be started to access property rank_roles")
         return self._rank_roles
 
-    @property
-    def event(self) -> asyncio.Event:
-        """The event that signals an update and progresses the game loop."""
-        return self._event
-
     @property
     def session_task(self) -> asyncio.Task | None:
         """The task that runs the game loop or None if the game loop isn't running."""
@@ -541,21 +558,36 @@ class GameSession:
 
     async def _fetch_rank_roles(self) -> None:
         """Fetch the rank role ids for this session from the database."""
-        record = await self.ctx.app.db.fetchrow("SELECT * FROM guilds WHERE guildId = $1", self.ctx.guild.id)
-        self._rank_roles = {
-            0: hikari.Snowflake(record["rank0role"]),
-            1: hikari.Snowflake(record["rank1role"]),
-            2: hikari.Snowflake(record["rank2role"]),
-            3: hikari.Snowflake(record["rank3role"]),
-        }
+        rank_roles = await self._session_manager.fetch_rank_roles(self.ctx.guild.id)
+        if rank_roles is None:
+            raise GameSessionError("Rank roles are not configured for this guild")
+
+        self._rank_roles = rank_roles
+        # Reverse lookup so each member role is checked once, the lowest rank wins if roles are shared
+        self._role_ranks = {role: rank for rank, role in reversed(self._rank_roles.items())}
+
+    def _get_rank_role(self, member: hikari.Member) -> int | None:
+        """Get the rank of this member's rank role, or None if they do not have one."""
+        rank_role: int | None = None
 
-    async def _get_player_object(self, member: hikari.Member) -> GamePlayer:
+        for role in member.role_ids:
+            rank = self._role_ranks.get(role)
+            if rank is not None:
+                rank_role = rank
+
+        return rank_role
+
+    def _get_player_object(self, member: hikari.Member, rank_role: int, db_member: DatabaseMember) -> GamePlayer:
         """Get a GamePlayer object for this member.
 
         Parameters
         ----------
         member : hikari.Member
             The member to get a GamePlayer object for.
+        rank_role : int
+            The rank of this member's rank role.
+        db_member : DatabaseMember
+            The stored member for this member.
 
         Returns
         -------
@@ -563,22 +595,6 @@ class GameSession:
             A GamePlayer object that corresponds to the member.
 
         """
-        rank_role: int | None = None
-
-        for role in member.role_ids:
-            for i in range(0, 4):
-                if role == self.rank_roles[i]:
-                    rank_role = i
-                    break
-
-        if rank_role is None:
-            rank_role = 0
-            await self.ctx.warn(
-                f"Assigned rank 0 (White) to {member.display_name} because they do not have a rank role"
-            )
-
-        db_member = await DatabaseMember.fetch(member.id, member.guild_id)
-
         game_player = GamePlayer(member, member.display_name, rank_role, db_member.rank, db_member.mu, db_member.sigma)
         self.ctx.app.game_session_manager.player_cache.set(member.id, game_player)
         return game_player
@@ -592,20 +608,37 @@ class GameSession:
             The list of members to get GamePlayer objects for.
 
         """
-        players: list[GamePlayer] = []
+        players: list[GamePlayer | None] = []
+        uncached: list[tuple[int, hikari.Member]] = []
 
-        for member in members:
+        for index, member in enumerate(members):
             cache_result = self._session_manager.player_cache.get(member.id, member.guild_id)
-            if cache_result:
-                players.append(cache_result)
-                continue
-
-            players.append(await self._get_player_object(member))
+            players.append(cache_result)
+            if not cache_result:
+                uncached.append((index, member))
+
+        if uncached:
+            # Players missing from the cache are fetched from the database in one query
+            db_members = await DatabaseMember.fetch_many([member.id for _, member in uncached], self.ctx.guild.id)
+            unranked: list[str] = []
+
+            for index, member in uncached:
+                rank_role = self._get_rank_role(member)
+                if rank_role is None:
+                    rank_role = 0
+                    unranked.append(member.display_name)
+
+                players[index] = self._get_player_object(member, rank_role, db_members[member.id])
+
+            if unranked:
+                await self.ctx.warn(
+                    f"Assigned rank 0 (White) to {', '.join(unranked)} because they do not have a rank role"
+                )
 
-        self._players = players
+        self._players = t.cast(list[GamePlayer], players)
 
     def _generate_matches(self) -> list[GameMatch]:
-        """Generate all possible GameMatches where the total skill level of each team is ordered.
+        """Generate the GameMatches with the most even teams, ordered by the difference in team skill level.
 
         Returns
         -------
@@ -613,43 +646,26 @@ class GameSession:
             A list of GameMatches with team pairs.
 
         """
-        unique_team_pairs = {}
+        roles = [player.role for player in self.players]
+        total_skill = sum(roles)
         results = []
 
-        # Generates all possible 4 player combinations
-        for team_a in itertools.combinations(range(8), 4):
-            team_a_sorted = tuple(sorted(team_a))
-            team_b_sorted = tuple(sorted(set(range(8)) - set(team_a)))
-
-            # Tuple sorting to avoid duplicates
-            key = tuple(sorted([team_a_sorted, team_b_sorted]))
-            if key in unique_team_pairs:
-                continue
-            unique_team_pairs[key] = True
+        for team_a, team_b in _TEAM_SPLITS:
+            team_a_skill = roles[team_a[0]] + roles[team_a[1]] + roles[team_a[2]] + roles[team_a[3]]
 
-            # Gets the total skill for each team
-            team_a_skill = sum(self.players[i].role for i in team_a_sorted)
-            team_b_skill = sum(self.players[i].role for i in team_b_sorted)
-            diff = abs(team_a_skill - team_b_skill)
-
-            results.append(
-                {"teams": key, "team_a_skill": team_a_skill, "team_b_skill": team_b_skill, "difference": diff}
-            )
-
-        # Sorts the results by team skill diff and takes top four (least diff)
-        results.sort(key=lambda r: r["difference"])
+            # Ties in skill difference fall back to the team, which is unique and in generation order
+            results.append((abs(2 * team_a_skill - total_skill), team_a, team_b, team_a_skill))
 
         teams = []
+        team_names = iter(create_team_names(2 * MAX_PROPOSED_MATCHES))
 
-        # Creates pairs of GameTeams
-        for team_pair in results:
-            team1, team2 = team_pair["teams"]
-
+        # Only the most even splits are offered for voting, so the rest are never turned into GameTeams
+        for _, team1, team2, team_a_skill in heapq.nsmallest(MAX_PROPOSED_MATCHES, results):
             team_a_players = [self.players[i] for i in team1]
             team_b_players = [self.players[i] for i in team2]
 
-            team_a = GameTeam(team_a_players, create_team_name(), team_pair["team_a_skill"])
-            team_b = GameTeam(team_b_players, create_team_name(), team_pair["team_b_skill"])
+            team_a = GameTeam(team_a_players, next(team_names), team_a_skill)
+            team_b = GameTeam(team_b_players, next(team_names), total_skill - team_a_skill)
 
             teams.append(GameMatch(team_a, team_b))
 
@@ -674,11 +690,15 @@ class GameSession:
         total_groups = math.floor(len(matches) / 4)
         round_index = 0
 
+        # Neither the voters nor the groups change between rounds of voting
+        members = [player.member for player in self._players]
+        groups = [matches[i : i + 4] for i in range(0, total_groups * 4, 4)]
+
         while True:
-            group_start = round_index % total_groups * 4
+            group = groups[round_index]
 
-            embed, fields = format_team_voting_embed(matches[group_start : group_start + 4])
-            vote = await self.ctx.team_vote([player.member for player in self._players], embed, fields, edit=True)
+            embed, fields = format_team_voting_embed(group)
+            vote = await self.ctx.team_vote(members, embed, fields, edit=True)
 
             if not vote:
                 embed = hikari.Embed(description=f"{FAIL_EMOJI} **No-one voted for a team**", colour=FAIL_EMBED_COLOUR)
@@ -696,8 +716,7 @@ class GameSession:
                     round_index = 0
                 continue
 
-            winner_index = group_start + (vote - 1)
-            return matches[winner_index]
+            return group[vote - 1]
 
     async def _handle_ranking(self) -> None:
         """Rate the session match with openskill and persist the adjustments.
@@ -710,68 +729,50 @@ class GameSession:
         model = self._session_manager.openskill_model
         tied = self._match.final_scores[0] == self._match.final_scores[1]
 
-        winners, losers = [], []
-        for member in self._match.winner.players:
-            winners.append(model.rating(member.mu, member.sigma, str(member.member.id)))
-        for member in self._match.loser.players:
-            losers.append(model.rating(member.mu, member.sigma, str(member.member.id)))
-
-        winners, losers = model.rate([winners, losers], ranks=[0, 0] if tied else None)
-
-        async with self.ctx.app.db.pool.acquire() as con:
-            for i in range(0, len(winners)):
-                await con.execute(
-                    """UPDATE members SET mu = $1, sigma = $2 WHERE userId = $3 AND guildId = $4""",
-                    winners[i].mu,
-                    winners[i].sigma,
-                    int(winners[i].name),
-                    self.ctx.guild.id,
-                )
-                await con.execute(
-                    """
-                    INSERT INTO memberAuditLog (userId, guildId, matchId, won, tied, mu, sigma)
-                    VALUES ($1, $2, $3, $4, $5, $6, $7)
-                    """,
-                    int(winners[i].name),
-                    self.ctx.guild.id,
-                    self.id,
-                    not tied,
-                    tied,
-                    winners[i].mu,
-                    winners[i].sigma,
-                )
+        winners, losers = model.rate(
+            [
+                [model.rating(player.mu, player.sigma, str(player.member.id)) for player in team.players]
+                for team in (self._match.winner, self._match.loser)
+            ],
+            ranks=[0, 0] if tied else None,
+        )
 
-                player = self._match.winner.players[i]
-                player.mu = winners[i].mu
-                player.sigma = winners[i].sigma
-                self._session_manager.player_cache.set(player.member.id, player)
-
-            for i in range(0, len(losers)):
-                await con.execute(
-                    """UPDATE members SET mu = $1, sigma = $2 WHERE userId = $3 AND guildId = $4""",
-                    losers[i].mu,
-                    losers[i].sigma,
-                    int(losers[i].name),
-                    self.ctx.guild.id,
-                )
-                await con.execute(
-                    """
-                    INSERT INTO memberAuditLog (userId, guildId, matchId, lost, tied, mu, sigma)
-                    VALUES ($1, $2, $3, $4, $5, $6, $7)
-                    """,
-                    int(losers[i].name),
-                    self.ctx.guild.id,
-                    self.id,
-                    not tied,
-                    tied,
-                    losers[i].mu,
-                    losers[i].sigma,
-                )
+        guild_id = self.ctx.guild.id
+        rated_players = [
+            *((player, rating, True) for player, rating in zip(self._match.winner.players, winners)),
+            *((player, rating, False) for player, rating in zip(self._match.loser.players, losers)),
+        ]
+
+        # All rating updates and audit logs are written in two batches within one transaction
+        async with self.ctx.app.db.pool.acquire() as con, con.transaction():
+            await con.executemany(
+                """UPDATE members SET mu = $1, sigma = $2 WHERE userId = $3 AND guildId = $4""",
+                [(rating.mu, rating.sigma, int(rating.name), guild_id) for _, rating, _ in rated_players],
+            )
+            await con.executemany(
+                """
+                INSERT INTO memberAuditLog (userId, guildId, matchId, won, lost, tied, mu, sigma)
+                VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
+                """,
+                [
+                    (
+                        int(rating.name),
+                        guild_id,
+                        self.id,
+                        won and not tied,
+                        not (won or tied),
+                        tied,
+                        rating.mu,
+                        rating.sigma,
+                    )
+                    for _, rating, won in rated_players
+                ],
+            )
 
-                player = self._match.loser.players[i]
-                player.mu = losers[i].mu
-                player.sigma = losers[i].sigma
-                self._session_manager.player_cache.set(player.member.id, player)
+        for player, rating, _ in rated_players:
+            player.mu = rating.mu
+            player.sigma = rating.sigma
+            self._session_manager.player_cache.set(player.member.id, player)
 
     async def _save_match(self) -> None:
         """Persist the match associated with this session in the database."""
@@ -805,8 +806,11 @@ class GameSession:
         }
         db_match.winner_data = winner_data
         db_match.loser_data = loser_data
-        await db_match.update()
-        await db_match.update_members()
+
+        # The match row and member stats are in separate tables, so each is written on its own pooled connection
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(db_match.update())
+            tg.create_task(db_match.update_members())
 
     async def _wait_for_scores(self) -> None:
         """Start the game loop waiting for scores.
@@ -817,19 +821,23 @@ class GameSession:
         round_no: int = 1
         timeout: bool = False
 
-        def update_match_stats() -> GameMatch:
-            if round_no == 1:
+        def update_match_stats(score: tuple[int, int] | None) -> GameMatch:
+            if score is None:
                 return self._match
 
-            score1, score2 = self._latest_score
+            score1, score2 = score
             winner = self._match.team1 if score1 > score2 else self._match.team2
 
             total_scores[0] += score1
             total_scores[1] += score2
-            setattr(self._match, f"round{round_no - 1}_scores", (score1, score2))
-            setattr(self._match, f"round{round_no - 1}_winner", winner)
 
-            if round_no == 3:
+            if round_no == 2:
+                self._match.round1_scores = (score1, score2)
+                self._match.round1_winner = winner
+            else:
+                self._match.round2_scores = (score1, score2)
+                self._match.round2_winner = winner
+
                 self._match.winner = self._match.team1 if total_scores[0] > total_scores[1] else self._match.team2
                 self._match.loser = self._match.team1 if total_scores[0] < total_scores[1] else self._match.team2
                 self._match.final_scores = (total_scores[0], total_scores[1])
@@ -840,17 +848,23 @@ class GameSession:
 
             return self._match
 
+        score: tuple[int, int] | None = None
+
         # Update loop for scores
-        while self.session_task and round_no < 3:
-            await self.ctx.send_round_update(round_no, update_match_stats(), map=self._map)
+        while round_no < 3:
+            await self.ctx.send_round_update(round_no, update_match_stats(score), map=self._map)
 
             try:
-                self.event.clear()
-                await asyncio.wait_for(self.event.wait(), timeout=3600)
-            except asyncio.TimeoutError:
+                async with asyncio.timeout(3600):
+                    score = await self._scores.get()
+            except TimeoutError:
                 timeout = True
                 break
 
+            # Checked after waiting, tasks start eagerly so the first round begins before the session task is assigned
+            if score is None or not self.session_task:
+                break
+
             round_no += 1
 
         if sum(total_scores) == 0 or not self.session_task:
@@ -863,7 +877,8 @@ class GameSession:
             return
 
         self._session_task = None
-        await self.ctx.send_round_update(round_no, update_match_stats(), map=self._map)
+        await self.ctx.send_round_update(round_no, update_match_stats(score), map=self._map)
+        # Ranking runs after saving, its audit logs reference the match row and it updates the same member rows
         await self._save_match()
         await self._handle_ranking()
         await self.ctx.send_match_summary(self._match, self.id)
@@ -882,8 +897,7 @@ class GameSession:
         if not self.session_task:
             raise GameSessionError("Session is not ready to receive scores")
 
-        self._latest_score = (score1, score2)
-        self.event.set()
+        self._scores.put_nowait((score1, score2))
 
     def set_map(self, map: str) -> None:
         """Add a map to this session.
@@ -899,7 +913,7 @@ class GameSession:
     def end(self) -> None:
         """End the game loop."""
         self._session_task = None
-        self._event.set()
+        self._scores.put_nowait(None)
 
     async def start(self, members: list[hikari.Member], force: bool = False) -> None:
         """Start this session and listening for interactions.
@@ -927,20 +941,24 @@ class GameSession:
             self._match = winning_match
 
         elif force:
-            team1 = GameTeam([player for player in self.players[:4]], create_team_name(), 0)
-            team2 = GameTeam([player for player in self.players[4:]], create_team_name(), 0)
+            team1_name, team2_name = create_team_names(2)
+            team1 = GameTeam(self.players[:4], team1_name, 0)
+            team2 = GameTeam(self.players[4:], team2_name, 0)
             self._match = GameMatch(team1, team2)
 
             await self.ctx.loading()
 
-        self._session_task = asyncio.create_task(self._wait_for_scores())
+        # Started eagerly, the first round update is sent without waiting for the loop to schedule the task
+        self._session_task = asyncio.eager_task_factory(asyncio.get_running_loop(), self._wait_for_scores())
         try:
-            await asyncio.wait_for(self._session_task, timeout=3610)
+            # Timing out cancels the awaited session task, as wait_for did, without wrapping it in another task
+            async with asyncio.timeout(3610):
+                await self._session_task
         except TimeoutError:
-            self._session_manager.remove_session(self.ctx.channel.id)
             return
-
-        self._session_manager.remove_session(self.ctx.channel.id)
+        finally:
+            # The session is unbound from its channel however the game loop ends, including on errors
+            self._session_manager.remove_session(self.ctx.channel.id)
 
         view = RetryView(author=self.ctx.author.id)
         msg = await self.ctx.edit_last_response(components=view)
@@ -11,6 +11,8 @@ from src.models.game_session import GamePlayer, GameSession
 if t.TYPE_CHECKING:
     from src.models.bot import BattleFrontBot
 
+FETCH_RANK_ROLES_SQL = "SELECT rank0Role, rank1Role, rank2Role, rank3Role FROM guilds WHERE guildId = $1"
+
 
 class PlayerCache:
     """Cache of GamePlayer objects for members."""
@@ -66,6 +68,7 @@ class GameSessionManager:
         self._player_cache = PlayerCache()
         self._last_registration_message: dict[hikari.Snowflake, hikari.Snowflake] = {}
         self._last_map: dict[hikari.Snowflake, str] = {}
+        self._rank_roles: dict[hikari.Snowflake, dict[int, hikari.Snowflake]] = {}
         self._session_count: int | None = None
         self._openskill_model = PlackettLuce(balance=True)
 
@@ -102,6 +105,45 @@ class GameSessionManager:
         """The openskill model used to rate players."""
         return self._openskill_model
 
+    async def fetch_rank_roles(self, guild_id: hikari.Snowflake) -> dict[int, hikari.Snowflake] | None:
+        """Fetch the rank role ids for a guild, cached until they are next changed.
+
+        Parameters
+        ----------
+        guild_id : hikari.Snowflake
+            The guild to fetch rank roles for.
+
+        Returns
+        -------
+        dict[int, hikari.Snowflake] | None
+            The role id for each rank or None if the guild has not configured all of its rank roles.
+
+        """
+        if rank_roles := self._rank_roles.get(guild_id):
+            return rank_roles
+
+        record = await self.app.db.fetchrow(FETCH_RANK_ROLES_SQL, guild_id)
+        if not record or None in record.values():
+            return None
+
+        rank_roles = self._rank_roles[guild_id] = {rank: hikari.Snowflake(role) for rank, role in enumerate(record)}
+        return rank_roles
+
+    def clear_rank_roles(self, guild_id: hikari.Snowflake | None = None) -> None:
+        """Remove the cached rank roles for a guild, must be called whenever they are changed.
+
+        Parameters
+        ----------
+        guild_id : hikari.Snowflake | None
+            The guild whose rank roles are no longer valid, if None the rank roles for every guild are removed.
+
+        """
+        if guild_id is None:
+            self._rank_roles.clear()
+            return
+
+        self._rank_roles.pop(guild_id, None)
+
     async def set_session_count(self) -> None:
         """Set the number of sessions ever created as fetched from the database."""
         session_count = await self.app.db.fetch("SELECT MAX(matchId) FROM matches")
@@ -162,10 +204,9 @@ class GameSessionManager:
         """
         session = self.fetch_session(channel_id)
         session.add_score(score1, score2)
-        session.event.set()
 
     def end_session(self, channel_id: hikari.Snowflake) -> None:
-        """End an ongoing session.
+        """End an ongoing session and remove it from the game session manager, does nothing if there is no session.
 
         Parameters
         ----------
@@ -173,7 +214,9 @@ class GameSessionManager:
             The channel id for the session that is being ended is bound to.
 
         """
-        self.fetch_session(channel_id).end()
+        session = self._sessions.pop(channel_id, None)
+        if session:
+            session.end()
 
     def remove_session(self, channel_id: hikari.Snowflake) -> None:
         """Remove a session from the game session manager if it exists.
@@ -184,8 +227,7 @@ class GameSessionManager:
             The channel id for the session that is being removed is bound to.
 
         """
-        if self.fetch_session(channel_id):
-            self._sessions.pop(channel_id)
+        self._sessions.pop(channel_id, None)
 
 
 # Copyright (C) 2025 BBombs
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+import hikari
+import psutil
+
+
+class StatsSampler:
+    """Sampler for bot process statistics that samples in the background."""
+
+    def __init__(self, process: psutil.Process, interval: float = 5.0, ttl: float = 2.0) -> None:
+        """Sampler for bot process statistics that samples in the background.
+
+        Parameters
+        ----------
+        process : psutil.Process
+            The process to sample memory usage for.
+        interval : float
+            How often in seconds the background task samples, defaults to 5.
+        ttl : float
+            How long in seconds a sample is reused for when the background task isn't running, defaults to 2.
+
+        """
+        self._process = process
+        self._interval = interval
+        self._ttl = ttl
+        self._task: asyncio.Task[None] | None = None
+        self._sampled_at: float | None = None
+        self._cpu_percent: float = 0.0
+        self._vms_mb: int = 0
+
+        # The first call only sets the baseline for later cpu percent samples
+        psutil.cpu_percent(interval=None)
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the background sampling task is running."""
+        return self._task is not None and not self._task.done()
+
+    def sample(self) -> None:
+        """Sample the current cpu and memory usage."""
+        self._cpu_percent = psutil.cpu_percent(interval=None)
+        self._vms_mb = round(self._process.memory_info().vms / 1048576)
+        self._sampled_at = time.monotonic()
+
+    async def _sample_loop(self) -> None:
+        while True:
+            self.sample()
+            await asyncio.sleep(self._interval)
+
+    def start(self) -> None:
+        """Start sampling in the background, does nothing if already running."""
+        if self.is_running:
+            return
+
+        self._task = asyncio.create_task(self._sample_loop())
+
+    def stop(self) -> None:
+        """Stop sampling in the background."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def snapshot(self) -> tuple[float, int]:
+        """Get the latest cpu and memory usage.
+
+        If the background task isn't running, samples again when the last sample has expired.
+
+        Returns
+        -------
+        tuple[float, int]
+            The system cpu usage as a percentage and the virtual memory used by the process in MB.
+
+        """
+        if not self.is_running and (self._sampled_at is None or time.monotonic() - self._sampled_at >= self._ttl):
+            self.sample()
+
+        return self._cpu_percent, self._vms_mb
+
+
+class InfoEmbedCache:
+    """Cache for the bot info embed, only its latency is refreshed while it is cached."""
+
+    def __init__(self, ttl: float = 2.0) -> None:
+        """Cache for the bot info embed, only its latency is refreshed while it is cached.
+
+        Parameters
+        ----------
+        ttl : float
+            How long in seconds the embed is reused for before it is rebuilt, defaults to 2.
+
+        """
+        self._ttl = ttl
+        self._built_at: float | None = None
+        self._embed: hikari.Embed | None = None
+        self._rest_ms: float = 0.0
+
+    def get(self) -> tuple[hikari.Embed, float] | None:
+        """Get the cached info embed and the REST latency measured when it was built.
+
+        Returns
+        -------
+        tuple[hikari.Embed, float] | None
+            The embed and REST latency in milliseconds, or None if there is no embed or it has expired.
+
+        """
+        if self._embed is None or self._built_at is None or time.monotonic() - self._built_at >= self._ttl:
+            return None
+
+        return self._embed, self._rest_ms
+
+    def set(self, embed: hikari.Embed, rest_ms: float) -> None:
+        """Cache a newly built info embed.
+
+        Parameters
+        ----------
+        embed : hikari.Embed
+            The info embed.
+        rest_ms : float
+            The REST latency in milliseconds measured while building the embed.
+
+        """
+        self._embed = embed
+        self._rest_ms = rest_ms
+        self._built_at = time.monotonic()
+
+
+# Copyright (C) 2025 BBombs
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
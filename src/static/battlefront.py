@@ -1,4 +1,4 @@
-__all__ = ["MAPS", "TEAM_NAME_KEY_1", "TEAM_NAME_KEY_2"]
+__all__ = ["MAPS", "MAP_CHOICES_NONZERO", "TEAM_NAME_KEY_1", "TEAM_NAME_KEY_2"]
 
 # Map name, index (distance from banned map)
 MAPS: dict[str, int] = {
@@ -27,6 +27,9 @@ MAPS: dict[str, int] = {
     "Crait": 0,
 }
 
+# Maps that are not banned (index above 0)
+MAP_CHOICES_NONZERO: tuple[str, ...] = tuple(m for m, v in MAPS.items() if v != 0)
+
 TEAM_NAME_KEY_1: list[str] = [
     "Lovely",
     "Huge",
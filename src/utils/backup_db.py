@@ -60,7 +60,7 @@ async def backup_db() -> hikari.File | None:
     stdout, stderr = await p.communicate()
 
     if result != 0:
-        logger.warning(f"Database backup failed:\n{stderr.decode('unicode_escape')}")
+        logger.warning("Database backup failed:\n%s", stderr.decode("unicode_escape"))
         return
 
     logger.info("A database backup was performed successfully")
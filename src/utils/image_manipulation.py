@@ -8,7 +8,7 @@ from PIL import Image, ImageDraw, ImageFont
 logger = logging.getLogger(__name__)
 
 
-def generate_game_banner(team_names: list[str], score: tuple[int, int], winning_players: list[str]) -> BytesIO:
+def generate_game_banner(team_names: list[str], score: tuple[int, int], winning_players: list[str]) -> bytes:
     """Generate a game summary banner by formating the winner template with the provided values.
 
     Should be run in a separate task.
@@ -24,8 +24,8 @@ def generate_game_banner(team_names: list[str], score: tuple[int, int], winning_
 
     Returns
     -------
-    BytesIO
-        The created jpeg image as bytes.
+    bytes
+        The created jpeg image, as bytes so it is returned from worker processes without copying a buffer object.
 
     """
     src_dir = str(Path(os.path.abspath(__file__)).parents[1])
@@ -35,7 +35,7 @@ def generate_game_banner(team_names: list[str], score: tuple[int, int], winning_
         img = Image.open(os.path.join(src_dir, "static", "img", "banner_template.jpg"))
     except FileNotFoundError:
         logger.error("Game banner template image 'src/static/img/banner_template.jpg' not found")
-        return buffer
+        return b""
 
     w, h = 1745, 769  # Image width, height
     template = ImageDraw.Draw(img)
@@ -83,7 +83,7 @@ def generate_game_banner(team_names: list[str], score: tuple[int, int], winning_
     template.text(r_emoji_position, r_emoji, font=emoji, fill=title2_colour, anchor="rm")
 
     img.save(buffer, format="jpeg")
-    return buffer
+    return buffer.getvalue()
 
 
 # Copyright (C) 2025 BBombs
@@ -0,0 +1,63 @@
+import json
+import typing as t
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(obj: t.Any) -> str:
+    """Serialize an object to a json string, using orjson when it is installed.
+
+    Parameters
+    ----------
+    obj : Any
+        The object to serialize, must be json serializable.
+
+    Returns
+    -------
+    str
+        The serialized object, as a string since asyncpg expects text for json columns.
+
+    """
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+
+    return json.dumps(obj)
+
+
+def loads(data: str | bytes) -> t.Any:
+    """Deserialize a json document, using orjson when it is installed.
+
+    Parameters
+    ----------
+    data : str | bytes
+        The json document to deserialize.
+
+    Returns
+    -------
+    Any
+        The deserialized object.
+
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+
+    return json.loads(data)
+
+
+# Copyright (C) 2025 BBombs
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.